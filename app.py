@@ -21,11 +21,12 @@ les pièces en fichiers PDF individuels, puis vous propose un ZIP à télécharg
 uploaded_file = st.file_uploader("Fichier PDF DossierFacile", type=["pdf"])
 
 if uploaded_file is not None:
-    pdf_bytes: bytes = uploaded_file.read()
     zip_basename: str = f"{Path(uploaded_file.name).stem}_extracted"
 
     with st.spinner("Traitement du PDF…"):
-        named_files = split_pdf_bytes_to_named_files(pdf_bytes)
+        # UploadedFile est un BytesIO déjà en mémoire: il est passé tel quel, sans
+        # recopier son contenu
+        named_files = split_pdf_bytes_to_named_files(uploaded_file)
         zip_filename, zip_bytes = build_zip_from_named_files(named_files, zip_basename)
 
     st.download_button(
@@ -3,6 +3,7 @@
 # dependencies = [
 #     "typer",
 #     "pypdf",
+#     "pymupdf",
 # ]
 # ///
 
@@ -10,9 +11,10 @@ from pathlib import Path
 
 import typer
 from core import (
+    open_pdf,
+    get_page_groups_from_document,
     get_page_titles,
-    group_consecutive_pages,
-    export_groups_to_pdfs,
+    export_groups_from_document_to_pdfs,
 )
 
 app = typer.Typer(
@@ -38,7 +40,8 @@ def split(
 ) -> None:
     """
     Découpe le PDF global en PDFs individuels par pièce justificative.
-    Le regroupement est fait en détectant les séquences de pages ayant le même titre.
+    Le regroupement suit les signets (sommaire) du PDF s'il en a; sinon il est fait en
+    détectant les séquences de pages ayant le même titre.
     """
     if not pdf_path.exists():
         typer.secho(
@@ -58,14 +61,18 @@ def split(
     typer.secho(f"Lecture du fichier: {pdf_path}", fg=typer.colors.BLUE)
 
     try:
-        titles = get_page_titles(pdf_path)
-        nb_pages = len(titles)
-        typer.secho(f"Nombre de pages: {nb_pages}", fg=typer.colors.GREEN)
-
-        groups = group_consecutive_pages(titles)
-        results = export_groups_to_pdfs(
-            pdf_path=pdf_path, groups=groups, dest_dir=dest_dir
-        )
+        # Un seul document ouvert pour la détection des pièces et l'export
+        doc = open_pdf(pdf_path)
+        try:
+            nb_pages = doc.page_count
+            typer.secho(f"Nombre de pages: {nb_pages}", fg=typer.colors.GREEN)
+
+            groups = get_page_groups_from_document(doc)
+            results = export_groups_from_document_to_pdfs(
+                doc=doc, groups=groups, dest_dir=dest_dir
+            )
+        finally:
+            doc.close()
 
         for res in results:
             start_display = res.group.start_idx + 1
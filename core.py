@@ -1,15 +1,66 @@
+from __future__ import annotations
+
 from dataclasses import dataclass
+from functools import lru_cache
 import io
-import zipfile
+import math
+import os
 from pathlib import Path
 import re
-import unicodedata
+import sys
+from typing import TYPE_CHECKING, BinaryIO
+
+import pymupdf
 
-from pypdf import PdfReader, PdfWriter
+# Modules importés à la demande dans les fonctions qui les utilisent, pour ne pas
+# alourdir le démarrage de la CLI (pypdf, multiprocessing, zipfile, ...).
+if TYPE_CHECKING:
+    from concurrent.futures import ThreadPoolExecutor
+
+    from pypdf import PdfReader, PdfWriter
 
 
 INTRO_FIRST_PAGE_TITLE = "Page de garde DossierFacile"
 
+# Nombre de pages à partir duquel l'extraction des titres est répartie sur plusieurs
+# processus. Mesuré: ~0,1 ms par page en séquentiel contre 30 à 60 ms de démarrage
+# du pool (chaque worker rouvre le PDF); le pool n'est rentable qu'au-delà de
+# quelques centaines de pages par worker.
+PARALLEL_MIN_PAGES = 1000
+# Nombre minimal de pages confiées à chaque worker.
+PAGES_PER_TITLE_WORKER = 500
+# ProcessPoolExecutor refuse plus de 61 workers sous Windows.
+MAX_TITLE_WORKERS = 61
+
+# Bibliothèque utilisée pour écrire les PDFs découpés: "mupdf" (par défaut, copie
+# des pages en natif) ou "pypdf" (ancienne implémentation, en pur Python).
+PDF_WRITER_BACKEND = os.environ.get("DOSSIER_FACILE_PDF_WRITER", "mupdf")
+if PDF_WRITER_BACKEND not in {"mupdf", "pypdf"}:
+    raise ValueError(
+        "DOSSIER_FACILE_PDF_WRITER doit valoir 'mupdf' ou 'pypdf', "
+        f"pas {PDF_WRITER_BACKEND!r}"
+    )
+
+# Nombre maximal de threads utilisés pour écrire les PDFs des différents groupes.
+EXPORT_MAX_THREADS = 8
+
+# Taille au-delà de laquelle le ZIP en cours de construction est écrit sur disque.
+ZIP_SPOOL_MAX_SIZE = 32 * 1024 * 1024
+
+_RE_STRIP = re.compile(r"[^a-z0-9\-\_\s]")
+_RE_WS = re.compile(r"\s+")
+# Passage en minuscules + suppression des caractères interdits, en une seule passe
+# (équivalent ASCII de `_RE_STRIP.sub("", text.lower())`).
+_ASCII_SLUG_TABLE = str.maketrans(
+    {
+        chr(code): None if _RE_STRIP.match(chr(code).lower()) else chr(code).lower()
+        for code in range(128)
+    }
+)
+_FR_TRANSLATE = str.maketrans(
+    "àâäçéèêëîïôöùûüÿÀÂÄÇÉÈÊËÎÏÔÖÙÛÜŸ", "aaaceeeeiioouuuyAAACEEEEIIOOUUUY"
+)
+
 
 @dataclass(frozen=True)
 class PageGroup:
@@ -28,25 +79,59 @@ class ExportResult:
     group: PageGroup
 
 
-def _extract_page_title(text: str) -> str:
-    """Retourne le titre (nom de la pièce) détecté pour une page.
+def _extract_page_title_from_lines(lines: list[str]) -> str:
+    """Retourne le titre (nom de la pièce) détecté à partir des premières lignes d'une page.
 
     Heuristique: privilégie la 4e ligne (index 3) si présente, sinon "unknown".
     """
-    if not text:
-        return "unknown"
-    lines = [line.strip() for line in text.split("\n")] if text else []
     if len(lines) > 3 and lines[3]:
         return lines[3]
     return "unknown"
 
 
+def _extract_page_title(page: pymupdf.Page) -> str:
+    """Retourne le titre détecté pour une page en ne lisant que ses premières lignes.
+
+    Les blocs de texte sont parcourus dans l'ordre du flux de contenu (comme
+    get_text("text")) et la lecture s'arrête dès que la ligne du titre est atteinte.
+    """
+    lines: list[str] = []
+    for block in page.get_text("blocks"):
+        # Parcours ligne à ligne avec str.find: on ne découpe que les lignes lues,
+        # pas tout le bloc.
+        text = block[4]
+        text_end = len(text) - 1 if text.endswith("\n") else len(text)
+        pos = 0
+        while True:
+            newline = text.find("\n", pos, text_end)
+            line_end = text_end if newline < 0 else newline
+            lines.append(text[pos:line_end].strip())
+            if len(lines) > 3:
+                return _extract_page_title_from_lines(lines)
+            if newline < 0:
+                break
+            pos = newline + 1
+    return _extract_page_title_from_lines(lines)
+
+
+@lru_cache(maxsize=512)
 def _slugify(value: str, max_length: int = 80) -> str:
     """Génère un nom de fichier sûr à partir d'un titre."""
-    normalized = unicodedata.normalize("NFKD", value or "document")
-    ascii_text = normalized.encode("ascii", "ignore").decode("ascii").lower()
-    ascii_text = re.sub(r"[^a-z0-9\-\_\s]", "", ascii_text)
-    ascii_text = re.sub(r"\s+", "-", ascii_text).strip("-") or "document"
+    value = value or "document"
+    if value.isascii():
+        # Rien à décomposer: évite unicodedata.normalize et l'aller-retour encode/decode
+        ascii_text = value.translate(_ASCII_SLUG_TABLE)
+    else:
+        # Accents français courants remplacés directement; la décomposition NFKD
+        # n'est faite que s'il reste des caractères non ASCII.
+        ascii_text = value.translate(_FR_TRANSLATE)
+        if not ascii_text.isascii():
+            import unicodedata
+
+            normalized = unicodedata.normalize("NFKD", ascii_text)
+            ascii_text = normalized.encode("ascii", "ignore").decode("ascii")
+        ascii_text = ascii_text.translate(_ASCII_SLUG_TABLE)
+    ascii_text = _RE_WS.sub("-", ascii_text).strip("-") or "document"
     return (
         (ascii_text[:max_length].rstrip("-"))
         if len(ascii_text) > max_length
@@ -54,34 +139,112 @@ def _slugify(value: str, max_length: int = 80) -> str:
     )
 
 
-def get_page_titles(pdf_path: Path) -> list[str]:
-    """Lit le PDF et renvoie la liste des titres détectés par page.
+# Source PDF (chemin ou bytes) transmise une seule fois à chaque worker.
+_worker_pdf_source: Path | bytes | None = None
 
-    La première page est forcée à INTRO_FIRST_PAGE_TITLE si le PDF contient au moins une page.
+
+def open_pdf(source: Path | bytes) -> pymupdf.Document:
+    """Ouvre un PDF (chemin ou bytes) avec MuPDF, pour le réutiliser entre plusieurs étapes."""
+    if isinstance(source, Path):
+        return pymupdf.open(source, filetype="pdf")
+    return pymupdf.open(stream=source, filetype="pdf")
+
+
+def _document_source(doc: pymupdf.Document) -> Path | bytes:
+    """Source permettant de rouvrir un document déjà ouvert (workers, pypdf)."""
+    if doc.name:
+        return Path(doc.name)
+    return doc.tobytes()
+
+
+def _init_titles_worker(source: Path | bytes) -> None:
+    global _worker_pdf_source
+    _worker_pdf_source = source
+
+
+def _extract_page_titles_range(start_idx: int, end_idx: int) -> list[str]:
+    """Extrait (dans un worker) les titres des pages start_idx..end_idx-1."""
+    doc = open_pdf(_worker_pdf_source)
+    try:
+        return [_extract_page_title(doc[idx]) for idx in range(start_idx, end_idx)]
+    finally:
+        doc.close()
+
+
+def _read_page_titles_in_parallel(
+    source: Path | bytes, nb_pages: int, max_workers: int
+) -> list[str]:
+    """Répartit l'extraction des titres sur max_workers processus, par tranches de pages."""
+    from concurrent.futures import ProcessPoolExecutor
+
+    chunk_size = math.ceil(nb_pages / max_workers)
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        initializer=_init_titles_worker,
+        initargs=(source,),
+    ) as executor:
+        futures = [
+            executor.submit(
+                _extract_page_titles_range,
+                start_idx,
+                min(start_idx + chunk_size, nb_pages),
+            )
+            for start_idx in range(0, nb_pages, chunk_size)
+        ]
+        return [sys.intern(title) for future in futures for title in future.result()]
+
+
+def _read_document_titles(
+    doc: pymupdf.Document, source: Path | bytes | None = None
+) -> list[str]:
+    """Renvoie les titres des pages d'un document déjà ouvert (depuis source si connue).
+
+    Les très gros PDFs lus depuis un fichier (CLI) sont répartis sur plusieurs
+    processus. Les PDFs en mémoire (application Streamlit) restent toujours lus dans
+    le processus courant: pas de fork d'un serveur multi-thread, et le document déjà
+    ouvert est réutilisé.
     """
-    reader = PdfReader(pdf_path)
-    titles: list[str] = []
-    for page in reader.pages:
-        text = page.extract_text() or ""
-        titles.append(_extract_page_title(text))
+    nb_pages = len(doc)
+    if source is None:
+        source = Path(doc.name) if doc.name else None
+    max_workers = min(
+        os.cpu_count() or 1, nb_pages // PAGES_PER_TITLE_WORKER, MAX_TITLE_WORKERS
+    )
+    # Titres internés: les nombreuses pages d'une même pièce partagent un seul objet
+    # str, et les comparaisons entre titres identiques se font par identité.
+    if not isinstance(source, Path) or nb_pages < PARALLEL_MIN_PAGES or max_workers < 2:
+        titles = [sys.intern(_extract_page_title(page)) for page in doc]
+    else:
+        # Chaque worker rouvre le PDF: on renonce ici à la lecture unique du
+        # document, ce qui n'est rentable que pour de très gros fichiers.
+        titles = _read_page_titles_in_parallel(source, nb_pages, max_workers)
     if len(titles) > 0:
         titles[0] = INTRO_FIRST_PAGE_TITLE
     return titles
 
 
+def _read_page_titles(source: Path | bytes) -> list[str]:
+    doc = open_pdf(source)
+    try:
+        return _read_document_titles(doc, source)
+    finally:
+        doc.close()
+
+
+def get_page_titles(pdf_path: Path) -> list[str]:
+    """Lit le PDF et renvoie la liste des titres détectés par page.
+
+    La première page est forcée à INTRO_FIRST_PAGE_TITLE si le PDF contient au moins une page.
+    """
+    return _read_page_titles(pdf_path)
+
+
 def get_page_titles_from_bytes(pdf_bytes: bytes) -> list[str]:
     """Lit un PDF en mémoire et renvoie la liste des titres détectés par page.
 
     La première page est forcée à INTRO_FIRST_PAGE_TITLE si le PDF contient au moins une page.
     """
-    reader = PdfReader(io.BytesIO(pdf_bytes))
-    titles: list[str] = []
-    for page in reader.pages:
-        text = page.extract_text() or ""
-        titles.append(_extract_page_title(text))
-    if len(titles) > 0:
-        titles[0] = INTRO_FIRST_PAGE_TITLE
-    return titles
+    return _read_page_titles(pdf_bytes)
 
 
 def group_consecutive_pages(page_titles: list[str]) -> list[PageGroup]:
@@ -106,52 +269,202 @@ def group_consecutive_pages(page_titles: list[str]) -> list[PageGroup]:
     return groups
 
 
-def export_groups_to_pdfs(
-    pdf_path: Path, groups: list[PageGroup], dest_dir: Path
-) -> list[ExportResult]:
-    """Exporte chaque groupe en un PDF distinct dans dest_dir et renvoie les résultats."""
-    dest_dir.mkdir(parents=True, exist_ok=True)
+def get_groups_from_outline(doc: pymupdf.Document) -> list[PageGroup] | None:
+    """Déduit les groupes de pages du sommaire (signets) du PDF, sans lire le texte.
+
+    Chaque entrée de premier niveau marque le début d'une pièce, qui s'étend jusqu'à
+    l'entrée suivante. Comme avec l'heuristique sur les titres, la première page forme
+    toujours la page de garde (INTRO_FIRST_PAGE_TITLE): si la première entrée commence
+    en page 1 et couvre d'autres pages, elle garde son titre à partir de la page 2.
+    Renvoie None si le sommaire compte moins de deux entrées de premier niveau ou est
+    inexploitable (entrées hors du document ou dans le désordre).
+    """
+    nb_pages = len(doc)
+    starts: list[tuple[int, str]] = []
+    for level, title, page_number in doc.get_toc(simple=True):
+        if level != 1:
+            continue
+        start_idx = page_number - 1
+        if not 0 <= start_idx < nb_pages:
+            return None
+        if starts and start_idx <= starts[-1][0]:
+            return None
+        starts.append((start_idx, sys.intern(title.strip())))
+    if len(starts) < 2:
+        return None
+
+    if starts[0][0] > 0:
+        starts.insert(0, (0, INTRO_FIRST_PAGE_TITLE))
+    elif starts[1][0] == 1:
+        starts[0] = (0, INTRO_FIRST_PAGE_TITLE)
+    else:
+        starts[0] = (1, starts[0][1])
+        starts.insert(0, (0, INTRO_FIRST_PAGE_TITLE))
+    ends = [start_idx - 1 for start_idx, _ in starts[1:]] + [nb_pages - 1]
+    return [
+        PageGroup(title=title, start_idx=start_idx, end_idx=end_idx)
+        for (start_idx, title), end_idx in zip(starts, ends)
+    ]
+
+
+def get_page_groups_from_document(
+    doc: pymupdf.Document, source: Path | bytes | None = None
+) -> list[PageGroup]:
+    """Renvoie les groupes de pages (une pièce par groupe) d'un PDF déjà ouvert.
+
+    Les groupes sont issus du sommaire si possible, sinon de l'heuristique sur les titres.
+    """
+    groups = get_groups_from_outline(doc)
+    if groups is not None:
+        return groups
+    return group_consecutive_pages(_read_document_titles(doc, source))
 
-    reader = PdfReader(pdf_path)
-    results: list[ExportResult] = []
 
+def _group_filename(group_index: int, group: PageGroup) -> str:
+    safe_title = group.title if group.title else f"document-{group_index}"
+    return f"{group_index:02d}-{_slugify(safe_title)}.pdf"
+
+
+def _extract_group_document(
+    doc: pymupdf.Document, group: PageGroup
+) -> pymupdf.Document:
+    """Copie (en natif, via MuPDF) les pages d'un groupe dans un nouveau document."""
+    part = pymupdf.open()
+    part.insert_pdf(doc, from_page=group.start_idx, to_page=group.end_idx)
+    return part
+
+
+def _export_groups_from_document_to_memory(
+    doc: pymupdf.Document, groups: list[PageGroup]
+) -> list[tuple[str, bytes]]:
+    """Exporte chaque groupe d'un document MuPDF déjà ouvert et renvoie (filename, content)."""
+    outputs: list[tuple[str, bytes]] = []
     for group_index, group in enumerate(groups, start=1):
-        safe_title = group.title if group.title else f"document-{group_index}"
-        filename = f"{group_index:02d}-{_slugify(safe_title)}.pdf"
-        output_path = dest_dir / filename
+        part = _extract_group_document(doc, group)
+        try:
+            outputs.append((_group_filename(group_index, group), part.tobytes()))
+        finally:
+            part.close()
+    return outputs
 
+
+def _build_group_writers(reader: PdfReader, groups: list[PageGroup]) -> list[PdfWriter]:
+    """Prépare un PdfWriter par groupe à partir d'un PdfReader partagé.
+
+    Fait séquentiellement: le PdfReader n'est pas thread-safe.
+    """
+    from pypdf import PdfWriter
+
+    writers: list[PdfWriter] = []
+    for group in groups:
         writer = PdfWriter()
-        for page_idx in range(group.start_idx, group.end_idx + 1):
-            writer.add_page(reader.pages[page_idx])
+        writer.append(
+            reader, pages=(group.start_idx, group.end_idx + 1), import_outline=False
+        )
+        writers.append(writer)
+    return writers
 
-        with output_path.open("wb") as f:
-            writer.write(f)
 
-        results.append(ExportResult(output_path=output_path, group=group))
+def _serialize_writer(writer: PdfWriter) -> bytes:
+    buffer = io.BytesIO()
+    writer.write(buffer)
+    # getvalue() rend directement le tampon interne du BytesIO, sans copie, tant
+    # qu'aucune vue (getbuffer) n'est ouverte dessus: ne pas passer par un memoryview.
+    return buffer.getvalue()
 
-    return results
 
+def _write_writer_to_file(writer: PdfWriter, output_path: Path) -> None:
+    with output_path.open("wb") as f:
+        writer.write(f)
 
-def export_groups_to_memory(
+
+def _export_thread_pool() -> ThreadPoolExecutor:
+    """Pool pour écrire les PDFs de chaque groupe en parallèle (chaque writer est indépendant)."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    return ThreadPoolExecutor(max_workers=min(EXPORT_MAX_THREADS, os.cpu_count() or 1))
+
+
+def _export_groups_to_pdfs_with_pypdf(
+    source: Path | bytes, groups: list[PageGroup], output_paths: list[Path]
+) -> None:
+    from pypdf import PdfReader
+
+    reader = PdfReader(
+        source if isinstance(source, Path) else io.BytesIO(source), strict=False
+    )
+    writers = _build_group_writers(reader, groups)
+    with _export_thread_pool() as executor:
+        # list() pour propager les éventuelles exceptions des workers
+        list(executor.map(_write_writer_to_file, writers, output_paths))
+
+
+def _export_groups_to_memory_with_pypdf(
     pdf_bytes: bytes, groups: list[PageGroup]
 ) -> list[tuple[str, bytes]]:
-    """Exporte chaque groupe en un PDF en mémoire et renvoie (filename, content)."""
-    reader = PdfReader(io.BytesIO(pdf_bytes))
-    outputs: list[tuple[str, bytes]] = []
+    from pypdf import PdfReader
 
-    for group_index, group in enumerate(groups, start=1):
-        safe_title = group.title if group.title else f"document-{group_index}"
-        filename = f"{group_index:02d}-{_slugify(safe_title)}.pdf"
+    reader = PdfReader(io.BytesIO(pdf_bytes), strict=False)
+    writers = _build_group_writers(reader, groups)
+    with _export_thread_pool() as executor:
+        contents = list(executor.map(_serialize_writer, writers))
+    return [
+        (_group_filename(group_index, group), content)
+        for group_index, (group, content) in enumerate(zip(groups, contents), start=1)
+    ]
 
-        writer = PdfWriter()
-        for page_idx in range(group.start_idx, group.end_idx + 1):
-            writer.add_page(reader.pages[page_idx])
 
-        buffer = io.BytesIO()
-        writer.write(buffer)
-        outputs.append((filename, buffer.getvalue()))
+def export_groups_from_document_to_pdfs(
+    doc: pymupdf.Document, groups: list[PageGroup], dest_dir: Path
+) -> list[ExportResult]:
+    """Exporte chaque groupe d'un PDF déjà ouvert en un PDF distinct dans dest_dir."""
+    dest_dir.mkdir(parents=True, exist_ok=True)
+
+    output_paths = [
+        dest_dir / _group_filename(group_index, group)
+        for group_index, group in enumerate(groups, start=1)
+    ]
+
+    if PDF_WRITER_BACKEND == "pypdf":
+        _export_groups_to_pdfs_with_pypdf(_document_source(doc), groups, output_paths)
+    else:
+        # PyMuPDF n'est pas thread-safe: les groupes sont écrits l'un après l'autre
+        for group, output_path in zip(groups, output_paths):
+            part = _extract_group_document(doc, group)
+            try:
+                part.save(output_path)
+            finally:
+                part.close()
+
+    return [
+        ExportResult(output_path=output_path, group=group)
+        for output_path, group in zip(output_paths, groups)
+    ]
+
+
+def export_groups_to_pdfs(
+    pdf_path: Path, groups: list[PageGroup], dest_dir: Path
+) -> list[ExportResult]:
+    """Exporte chaque groupe en un PDF distinct dans dest_dir et renvoie les résultats."""
+    doc = open_pdf(pdf_path)
+    try:
+        return export_groups_from_document_to_pdfs(doc, groups, dest_dir)
+    finally:
+        doc.close()
 
-    return outputs
+
+def export_groups_to_memory(
+    pdf_bytes: bytes, groups: list[PageGroup]
+) -> list[tuple[str, bytes]]:
+    """Exporte chaque groupe en un PDF en mémoire et renvoie (filename, content)."""
+    if PDF_WRITER_BACKEND == "pypdf":
+        return _export_groups_to_memory_with_pypdf(pdf_bytes, groups)
+
+    doc = open_pdf(pdf_bytes)
+    try:
+        return _export_groups_from_document_to_memory(doc, groups)
+    finally:
+        doc.close()
 
 
 def split_pdf_by_titles(
@@ -166,42 +479,75 @@ def split_pdf_by_titles(
 
     dest_dir = output_dir or (pdf_path.parent / f"{pdf_path.stem}_extracted")
 
-    titles = get_page_titles(pdf_path)
-    groups = group_consecutive_pages(titles)
-    return export_groups_to_pdfs(pdf_path=pdf_path, groups=groups, dest_dir=dest_dir)
+    doc = open_pdf(pdf_path)
+    try:
+        groups = get_page_groups_from_document(doc, pdf_path)
+        return export_groups_from_document_to_pdfs(doc, groups, dest_dir)
+    finally:
+        doc.close()
 
 
-def split_pdf_bytes_to_named_files(pdf_bytes: bytes) -> list[tuple[str, bytes]]:
-    """Découpe un PDF (bytes) en PDFs individuels (en mémoire) nommés.
+def _read_pdf_bytes(pdf: bytes | BinaryIO) -> bytes:
+    """Contenu complet d'un PDF passé en bytes ou en fichier binaire ouvert.
+
+    Le fichier est toujours lu en entier, quelle que soit sa position courante. Pour un
+    io.BytesIO (comme l'UploadedFile de Streamlit), getvalue() renvoie le tampon
+    existant sans le copier.
+    """
+    if isinstance(pdf, bytes):
+        return pdf
+    if isinstance(pdf, io.BytesIO):
+        return pdf.getvalue()
+    pdf.seek(0)
+    return pdf.read()
+
+
+def split_pdf_bytes_to_named_files(pdf: bytes | BinaryIO) -> list[tuple[str, bytes]]:
+    """Découpe un PDF (bytes ou fichier binaire) en PDFs individuels (en mémoire) nommés.
 
     Renvoie une liste de tuples (filename, content_bytes).
     """
-    titles = get_page_titles_from_bytes(pdf_bytes)
-    groups = group_consecutive_pages(titles)
-    return export_groups_to_memory(pdf_bytes=pdf_bytes, groups=groups)
+    pdf_bytes = _read_pdf_bytes(pdf)
+    # Un seul parsing du PDF: les titres et les pages exportées viennent du même document
+    doc = open_pdf(pdf_bytes)
+    try:
+        groups = get_page_groups_from_document(doc, pdf_bytes)
+        if PDF_WRITER_BACKEND == "pypdf":
+            return _export_groups_to_memory_with_pypdf(pdf_bytes, groups)
+        return _export_groups_from_document_to_memory(doc, groups)
+    finally:
+        doc.close()
 
 
 def build_zip_from_named_files(
-    named_files: list[tuple[str, bytes]], zip_basename: str
+    named_files: list[tuple[str, bytes]], zip_basename: str, compress: bool = False
 ) -> tuple[str, bytes]:
     """Construit un ZIP en mémoire à partir d'une liste (filename, content_bytes).
 
+    Par défaut les fichiers sont stockés sans compression: les flux d'un PDF sont
+    déjà compressés, un deflate supplémentaire coûte du CPU sans gain de taille.
     Renvoie (zip_filename, zip_bytes).
     """
+    import tempfile
+    import zipfile
+
     zip_name = f"{_slugify(zip_basename or 'extracted')}.zip"
-    buffer = io.BytesIO()
-    with zipfile.ZipFile(buffer, mode="w", compression=zipfile.ZIP_DEFLATED) as zf:
-        for filename, content in named_files:
-            # Evite les chemins dans les noms
-            arcname = Path(filename).name
-            zf.writestr(arcname, content)
-    return zip_name, buffer.getvalue()
+    compression = zipfile.ZIP_DEFLATED if compress else zipfile.ZIP_STORED
+    # Les petits ZIP restent en mémoire, les gros sont construits sur disque
+    with tempfile.SpooledTemporaryFile(max_size=ZIP_SPOOL_MAX_SIZE) as buffer:
+        with zipfile.ZipFile(buffer, mode="w", compression=compression) as zf:
+            for filename, content in named_files:
+                # Evite les chemins dans les noms
+                arcname = Path(filename).name
+                zf.writestr(arcname, content)
+        buffer.seek(0)
+        return zip_name, buffer.read()
 
 
 def split_pdf_bytes_to_zip(
-    pdf_bytes: bytes, zip_basename: str | None = None
+    pdf: bytes | BinaryIO, zip_basename: str | None = None
 ) -> tuple[str, bytes]:
     """Pipeline complet: découpe un PDF en mémoire et renvoie un ZIP (nom, bytes)."""
-    named_files = split_pdf_bytes_to_named_files(pdf_bytes)
+    named_files = split_pdf_bytes_to_named_files(pdf)
     base = zip_basename or "extracted"
     return build_zip_from_named_files(named_files, base)